@@ -10,11 +10,15 @@ This example demonstrates key pydantic concepts:
 - Data conversion
 - Error handling
 - Working with JSON
+- A faster alternative for hot paths with msgspec
+- Compact binary serialization with MessagePack
 """
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
 from typing import Optional
-import json
+import sys
+import msgspec  # Very fast validation + serialization library written in C
+import orjson  # Fast JSON library written in Rust
 
 # 1. DEFINING A PYDANTIC MODEL
 # =============================
@@ -30,6 +34,18 @@ class User(BaseModel):
     - Clear error messages
     """
     
+    model_config = ConfigDict(
+        # Build the validator when the class is created rather than on first
+        # use, so the first real validation call is as fast as every later one
+        # (this is pydantic's default, written out to show the choice)
+        defer_build=False,
+        
+        # Make instances immutable (and hashable). Nothing here changes a
+        # user after creating it, so any attempt to assign an attribute
+        # raises a ValidationError instead of quietly changing the data.
+        frozen=True,
+    )
+    
     # Required fields with type annotations
     name: str              # Must be a string
     age: int              # Must be an integer
@@ -42,6 +58,15 @@ class User(BaseModel):
     is_active: bool = True  # Default is True if not provided
 
 
+# A TypeAdapter holds a ready-to-use validator for a type.
+# Creating it once here means every call below reuses the same compiled
+# validator instead of looking it up again on the class each time.
+_USER_ADAPTER = TypeAdapter(User)
+
+# The same idea for a whole list of users: one call validates every item
+_USERS_ADAPTER = TypeAdapter(list[User])
+
+
 # 2. CREATING VALID USERS
 # ========================
 
@@ -120,6 +145,17 @@ def demonstrate_validation_errors():
 # 4. WORKING WITH JSON DATA
 # ==========================
 
+def _dumps(value) -> str:
+    """
+    Convert plain Python data (dicts, lists, strings, numbers) to a JSON string.
+
+    orjson does the encoding in compiled Rust code, which is several times
+    faster than the standard library's json module. orjson returns bytes,
+    so we decode them to get a regular string.
+    """
+    return orjson.dumps(value).decode()
+
+
 def json_examples():
     """Demonstrates JSON serialization and parsing."""
     
@@ -134,7 +170,9 @@ def json_examples():
     )
     
     # Convert user object to JSON string
-    user_json = user.model_dump_json()  # Pydantic method to create JSON
+    # model_dump(mode='json') gives a dict of JSON-friendly values,
+    # then orjson turns that dict into a JSON string very quickly
+    user_json = _dumps(user.model_dump(mode='json'))
     print(f"User as JSON: {user_json}")
     print()
     
@@ -145,7 +183,8 @@ def json_examples():
     
     # Create user from JSON string
     json_data = '{"name": "Grace Hopper", "age": 85, "email": "grace@example.com"}'
-    user_from_json = User.model_validate_json(json_data)  # Parse JSON into User
+    # validate_json parses and validates in a single pass (no dict in between)
+    user_from_json = _USER_ADAPTER.validate_json(json_data)  # Parse JSON into User
     print(f"User from JSON: {user_from_json}")
     print()
     
@@ -156,9 +195,25 @@ def json_examples():
         "email": "henry@example.com",
         "is_active": False
     }
-    user_from_dict = User.model_validate(dict_data)  # Create from dict
+    user_from_dict = _USER_ADAPTER.validate_python(dict_data)  # Create from dict
     print(f"User from dict: {user_from_dict}")
     print()
+    
+    # Create many users at once (the recommended bulk path)
+    # Instead of looping and validating one JSON record at a time, join the
+    # records into a single JSON array and validate it with one call.
+    # Python hands the work to pydantic's Rust core once, not once per user.
+    json_lines = [
+        b'{"name": "Ada Lovelace", "age": 36, "email": "ada@example.com"}',
+        b'{"name": "Alan Turing", "age": 41, "email": "alan@example.com"}',
+    ]
+    users = _USERS_ADAPTER.validate_json(b'[' + b','.join(json_lines) + b']')
+    print(f"Users from JSON lines: {[u.name for u in users]}")
+    
+    # Lists of dictionaries work the same way
+    users = _USERS_ADAPTER.validate_python([dict_data, user_dict])
+    print(f"Users from dicts: {[u.name for u in users]}")
+    print()
 
 
 # 5. ADVANCED FEATURES PREVIEW
@@ -166,6 +221,8 @@ def json_examples():
 
 class Address(BaseModel):
     """A nested model to show composition."""
+    # Same settings as User: build up front, immutable
+    model_config = ConfigDict(defer_build=False, frozen=True)
     street: str
     city: str
     country: str = "USA"  # Default value
@@ -173,6 +230,8 @@ class Address(BaseModel):
 
 class AdvancedUser(BaseModel):
     """User with nested address model."""
+    # Same settings as User: build up front, immutable
+    model_config = ConfigDict(defer_build=False, frozen=True)
     name: str
     age: int
     email: str
@@ -201,7 +260,114 @@ def advanced_example():
     print()
 
 
-# 6. MAIN EXECUTION
+# 6. FAST PATH WITH MSGSPEC
+# ==========================
+#
+# msgspec.Struct looks a lot like a pydantic model: you declare fields with
+# type annotations and defaults. The difference is that a Struct is a
+# C-level object with fixed slots (no per-instance __dict__), and msgspec
+# validates while it decodes JSON instead of in a separate step.
+# This makes creating and decoding objects several times faster.
+#
+# The pydantic models above stay the "teaching" models; these mirrors show
+# what you would reach for when the same data is decoded very often.
+# 📚 Explained in lessons/01_pydantic_introduction.md, "Going Faster".
+
+class UserFast(msgspec.Struct):
+    """msgspec mirror of the User model."""
+    name: str
+    age: int
+    email: str
+    nickname: Optional[str] = None
+    is_active: bool = True
+
+
+class AddressFast(msgspec.Struct):
+    """msgspec mirror of the Address model."""
+    street: str
+    city: str
+    country: str = "USA"
+
+
+class AdvancedUserFast(msgspec.Struct):
+    """msgspec mirror of the AdvancedUser model (nesting works the same way)."""
+    name: str
+    age: int
+    email: str
+    address: AddressFast
+
+
+def msgspec_examples():
+    """Shows the same JSON round-trip done with msgspec Structs."""
+
+    print("=== Fast Path with msgspec ===")
+
+    # Decode and validate JSON in a single step
+    json_data = b'{"name": "Grace Hopper", "age": 85, "email": "grace@example.com"}'
+    user = msgspec.json.decode(json_data, type=UserFast)
+    print(f"User from JSON: {user}")
+
+    # Encode straight back to JSON bytes
+    print(f"User as JSON: {msgspec.json.encode(user).decode()}")
+
+    # Validation errors are still raised, just with a different exception type
+    try:
+        msgspec.json.decode(b'{"name": "Eve Adams", "email": "eve@example.com"}', type=UserFast)
+    except msgspec.ValidationError as e:
+        print(f"❌ Error: {e}")
+
+    # Nested Structs are decoded in the same pass
+    advanced_user = msgspec.json.decode(
+        b'{"name": "Ivy Chen", "age": 29, "email": "ivy@example.com",'
+        b' "address": {"street": "123 Main St", "city": "San Francisco"}}',
+        type=AdvancedUserFast,
+    )
+    print(f"User's city: {advanced_user.address.city}")
+    print()
+
+
+def dump_msgpack(obj) -> bytes:
+    """
+    Serialize a Struct (or plain Python data) to MessagePack bytes.
+
+    MessagePack is a binary format with the same shapes as JSON (maps,
+    arrays, strings, numbers) but smaller and faster to read and write.
+    It is a good fit for saving data or sending it between services.
+    """
+    return msgspec.msgpack.encode(obj)
+
+
+def load_msgpack(data: bytes, cls):
+    """Decode MessagePack bytes and validate them as an instance of `cls`."""
+    return msgspec.msgpack.decode(data, type=cls)
+
+
+def msgpack_examples():
+    """Shows a MessagePack round-trip with the UserFast Struct."""
+
+    print("=== MessagePack Examples ===")
+
+    user = UserFast(name="Frank Miller", age=42, email="frank@example.com", nickname="Frankie")
+
+    # Binary encoding is noticeably smaller than the JSON text
+    packed = dump_msgpack(user)
+    print(f"MessagePack size: {len(packed)} bytes "
+          f"(JSON: {len(msgspec.json.encode(user))} bytes)")
+
+    # Decoding validates the data against the Struct, just like JSON decoding
+    print(f"User from MessagePack: {load_msgpack(packed, UserFast)}")
+
+    # When several messages are sent over one stream (a socket, a file),
+    # the reader needs to know where each message ends. A common answer is
+    # "length-prefix framing": write the message size as 4 bytes first,
+    # then the message itself. The reader reads 4 bytes, then that many more.
+    frame = len(packed).to_bytes(4, "big") + packed
+    size = int.from_bytes(frame[:4], "big")
+    print(f"Framed message: 4-byte header says {size} bytes follow")
+    print()
+
+
+# 7. MAIN EXECUTION
 # =================
 
 def main():
@@ -216,27 +382,39 @@ def main():
     - How to structure a Python script
     """
     
-    print("🐍 Pydantic Introduction Example")
-    print("📚 Corresponds to lessons/01_pydantic_introduction.md")
-    print("💡 Read the lesson for detailed explanations of each concept\n")
+    # Collect the lines first and write them with one call:
+    # each print() is a separate write to the terminal, one write is cheaper
+    banner = [
+        "🐍 Pydantic Introduction Example",
+        "📚 Corresponds to lessons/01_pydantic_introduction.md",
+        "💡 Read the lesson for detailed explanations of each concept",
+        "",
+    ]
+    sys.stdout.write("\n".join(banner) + "\n")
     
     # Run each example function
     create_valid_users()
     demonstrate_validation_errors()
     json_examples()
     advanced_example()
+    msgspec_examples()
+    msgpack_examples()
     
-    print("✅ All examples completed!")
-    print("\nKey takeaways:")
-    print("- Pydantic validates data automatically")
-    print("- Type hints make code clear and safe")
-    print("- JSON conversion is built-in")
-    print("- Error messages are helpful and specific")
-    
-    print("\n📖 Next steps:")
-    print("- Read lessons/02_pydantic_best_practices.md for advanced features")
-    print("- Run examples/02_pydantic_best_practices.py for advanced examples")
-    print("- Try creating your own models with the patterns you've learned")
+    summary = [
+        "✅ All examples completed!",
+        "",
+        "Key takeaways:",
+        "- Pydantic validates data automatically",
+        "- Type hints make code clear and safe",
+        "- JSON conversion is built-in",
+        "- Error messages are helpful and specific",
+        "",
+        "📖 Next steps:",
+        "- Read lessons/02_pydantic_best_practices.md for advanced features",
+        "- Run examples/02_pydantic_best_practices.py for advanced examples",
+        "- Try creating your own models with the patterns you've learned",
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")
 
 
 # This is a Python idiom - only run main() if this file is executed directly
